@@ -11,37 +11,16 @@ Author: ViewtifulSlayer
 __version__ = "1.0.0"
 __author__ = "ViewtifulSlayer"
 
-# Import all public functions for easy access
-from .metadata_validator import (
-    # Core validation functions
-    validate_metadata,
-    normalize_date_format,
-    extract_metadata_block,
-    
-    # Changelog functions
-    find_changelog_file,
-    extract_changelog_section_from_file,
-    determine_changelog_preference,
-    extract_latest_version_from_changelog,
-    check_changelog_consistency,
-    suggest_changelog_entry,
-    suggest_changelog_placement,
-    normalize_changelog_dates,
-    validate_changelog_date_format,
-    
-    # Utility functions
-    display_metadata,
-    prettify_filename,
-    
-    # Main function
-    main
-)
-
 __all__ = [
     'validate_metadata',
     'normalize_date_format', 
     'extract_metadata_block',
+    'extract_metadata_block_from_path',
+    'header_scan',
+    'extract_first_heading',
     'find_changelog_file',
+    'find_changelog_files',
+    'iter_md_files',
     'extract_changelog_section_from_file',
     'determine_changelog_preference',
     'extract_latest_version_from_changelog',
@@ -52,5 +31,26 @@ __all__ = [
     'validate_changelog_date_format',
     'display_metadata',
     'prettify_filename',
-    'main'
-] 
\ No newline at end of file
+    'validate_one',
+    'main',
+    'METADATA_PATTERNS',
+    'DATE_PATTERNS',
+    'CHANGELOG_PATTERNS'
+]
+
+# Public functions are resolved lazily (PEP 562) so that importing the package
+# does not pay for loading the validator module until a symbol is needed.
+_LAZY = set(__all__)
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        from . import metadata_validator as _module
+        value = getattr(_module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _LAZY)
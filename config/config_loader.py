@@ -90,7 +90,8 @@ class ConfigLoader:
                 "pattern": "\\d{4}-\\d{2}-\\d{2}",
                 "iso_format": "YYYY-MM-DD",
                 "current_date": "2025-07-05",
-                "description": "ISO 8601 date format for all date fields"
+                "description": "ISO 8601 date format for all date fields",
+                "locale": "us"
             },
             "defaults": {
                 "Document Title": "Unknown",
@@ -178,6 +179,11 @@ class ConfigLoader:
                 "final_timeout": None,
                 "note": "Set to null to disable timeouts"
             },
+            "cache": {
+                "description": "Persistent cache of changelog parse results, keyed by file content hash",
+                "enabled": False,
+                "path": ".mdv_cache.sqlite"
+            },
             "validation": {
                 "description": "Validation behavior settings",
                 "auto_update_last_updated": True,
@@ -213,6 +219,12 @@ class ConfigLoader:
             return "\\d{4}-\\d{2}-\\d{2}"
         return self._config.get("date_format", {}).get("pattern", "\\d{4}-\\d{2}-\\d{2}")
     
+    def get_date_locale(self) -> str:
+        """Get the locale ('us' or 'eu') used to read ambiguous numeric dates."""
+        if self._config is None:
+            return "us"
+        return self._config.get("date_format", {}).get("locale", "us")
+    
     def get_defaults(self) -> Dict[str, Any]:
         """Get default values for metadata fields."""
         if self._config is None:
@@ -231,6 +243,12 @@ class ConfigLoader:
             return {}
         return self._config.get("timeout_config", {})
     
+    def get_cache_config(self) -> Dict[str, Any]:
+        """Get persistent parse cache settings."""
+        if self._config is None:
+            return {}
+        return self._config.get("cache", {})
+    
     def get_validation_config(self) -> Dict[str, Any]:
         """Get validation behavior settings."""
         if self._config is None:
@@ -280,6 +298,8 @@ class ConfigLoader:
         date_format = self._config.get("date_format", {})
         if "pattern" not in date_format:
             errors.append("date_format must contain a pattern")
+        if date_format.get("locale", "us") not in ("us", "eu"):
+            errors.append("date_format locale must be 'us' or 'eu'")
         
         return errors
 
@@ -319,6 +339,11 @@ def get_date_pattern() -> str:
     return get_config_loader().get_date_pattern()
 
 
+def get_date_locale() -> str:
+    """Get the locale ('us' or 'eu') used to read ambiguous numeric dates."""
+    return get_config_loader().get_date_locale()
+
+
 def get_defaults() -> Dict[str, Any]:
     """Get default values for metadata fields."""
     return get_config_loader().get_defaults()
@@ -334,6 +359,11 @@ def get_timeout_config() -> Dict[str, Any]:
     return get_config_loader().get_timeout_config()
 
 
+def get_cache_config() -> Dict[str, Any]:
+    """Get persistent parse cache settings."""
+    return get_config_loader().get_cache_config()
+
+
 def get_validation_config() -> Dict[str, Any]:
     """Get validation behavior settings."""
     return get_config_loader().get_validation_config()
@@ -10,17 +10,33 @@ Enhanced metadata validator for markdown documentation files.
 - Includes timeout handling and gentle prompts for better UX.
 """
 import re
+import stat
 import sys
+import functools
 import os
 import time
+import io
+import mmap
+import contextlib
 import threading
-from datetime import datetime
-import subprocess
+import selectors
+from collections import Counter, deque
+from datetime import date
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from types import MappingProxyType
 from typing import Optional
 
+# Optional RE2 engine for whole-file changelog scans (linear-time, no backtracking)
+try:
+    import re2 as _re_impl
+except ImportError:
+    # Fall back to the standard library engine if google-re2 is not installed
+    _re_impl = re
+
 # Import configuration system
 try:
-    from config.config_loader import get_config_loader, get_required_fields, get_date_pattern, get_defaults, get_timeout_config
+    from config.config_loader import get_config_loader, get_required_fields, get_date_pattern, get_date_locale, get_defaults, get_timeout_config, get_cache_config
 except ImportError:
     # Fallback to hardcoded values if config system is not available
     def get_required_fields():
@@ -29,6 +45,9 @@ except ImportError:
     def get_date_pattern():
         return r'\d{4}-\d{2}-\d{2}'
     
+    def get_date_locale():
+        return 'us'
+    
     def get_defaults():
         return {
             'Document Title': 'Unknown',
@@ -45,92 +64,208 @@ except ImportError:
             'gentle_prompt_delay': None,
             'final_timeout': None
         }
+    
+    def get_cache_config():
+        return {
+            'enabled': False,
+            'path': '.mdv_cache.sqlite'
+        }
 
 # Load configuration values
 REQUIRED_FIELDS = get_required_fields()
 ISO_DATE_PATTERN = get_date_pattern()
+DATE_LOCALE = get_date_locale()
 DEFAULTS = get_defaults()
 TIMEOUT_CONFIG = get_timeout_config()
+CACHE_CONFIG = get_cache_config()
+
+# Required fields other than the date fields (which are checked separately), with their defaults
+_OTHER_REQUIRED = tuple(field for field in REQUIRED_FIELDS if field not in ('Created', 'Last Updated'))
+_OTHER_DEFAULTS = {field: DEFAULTS.get(field, '') for field in _OTHER_REQUIRED}
+
+# Changelog file names, in order of preference
+CHANGELOG_FILENAMES = ('CHANGELOG.md', 'changelog.md', 'Changelog.md')
 
 # Timeout configuration - DISABLED
 INITIAL_TIMEOUT = TIMEOUT_CONFIG.get('initial_timeout')
 GENTLE_PROMPT_DELAY = TIMEOUT_CONFIG.get('gentle_prompt_delay')
 FINAL_TIMEOUT = TIMEOUT_CONFIG.get('final_timeout')
 
+# Separator lines for console output, built once
+SEP = '=' * 60
+SEPN = '\n' + SEP
+
+# Compiled regular expressions (compiled once at import, reused on every call)
+ISO_DATE_RE = re.compile(ISO_DATE_PATTERN)
+# With the default pattern, ISO dates can be recognized without entering the regex engine
+_ISO_FAST_PATH = ISO_DATE_PATTERN == r'\d{4}-\d{2}-\d{2}'
+_STRICT_ISO_DATE_RE = re.compile(r'\d{4}-\d{2}-\d{2}')
+_METADATA_FIELD_RE = re.compile(r'- \*\*(.+?):\*\*(?: (.*))?$')
+_HEADING_RE = re.compile(r'#+\s+(.+)')
+# Changelog section headings (Changelog / History / Version History) and section boundaries
+_CHANGELOG_SECTION_RE = re.compile(r'(?:#{1,4} +Changelog|## +History|## +Version History) *$', re.IGNORECASE)
+_TOP_SECTION_RE = re.compile(r'#{1,2} +[^\[]')
+_VERSION_SECTION_RE = re.compile(r'## +\[')
+# Versions like ## [1.0.0], [1.0.0] or ## 1.0.0; the bracketed form covers ## [1.0.0] too,
+# so one alternation finds every version in a single pass
+_VERSION_RE = re.compile(r'\[([0-9]+)\.([0-9]+)\.([0-9]+)\]|## ([0-9]+)\.([0-9]+)\.([0-9]+)')
+# Changelog headings like: ## [1.2.0] - <date> (scanned over whole files)
+_CHANGELOG_HEADING_MARKER = '## ['
+_CHANGELOG_DATE_HEADING_RE = _re_impl.compile(r'(## \[[0-9]+\.[0-9]+\.[0-9]+\] - )(.*)')
+
+# Month names accepted in dates, mapped to their numbers; abbreviations are the first three letters
+_MONTH_FULL = {name: number for number, name in enumerate(
+    ('January', 'February', 'March', 'April', 'May', 'June', 'July',
+     'August', 'September', 'October', 'November', 'December'), 1)}
+_MONTH_ABBR = {name[:3]: number for name, number in _MONTH_FULL.items()}
+_MONTH_NUMBER = {**_MONTH_FULL, **_MONTH_ABBR}
+_MONTH = '(' + '|'.join(_MONTH_NUMBER) + ')'
+
+# Every supported (non-ISO) date shape as (branch name, pattern); each pattern holds exactly
+# three capture groups. Shapes that overlap are listed first so one fullmatch picks a branch.
+# Separators never span a line break, so the alternation can be embedded in line-based patterns.
+_DATE_ALTS = (
+    ('slash_long', r'(\d{1,2})/(\d{1,2})/(\d{4})'),
+    ('slash_short', r'(\d{1,2})/(\d{1,2})/(\d{2})'),
+    ('dash_long', r'(\d{1,2})-(\d{1,2})-(\d{4})'),
+    ('dash_short', r'(\d{1,2})-(\d{1,2})-(\d{2})'),
+    ('year_slash', r'(\d{4})/(\d{1,2})/(\d{1,2})'),
+    ('year_dot', r'(\d{4})\.(\d{1,2})\.(\d{1,2})'),
+    ('dot_ambiguous', r'(\d{2})\.(\d{1,2})\.(\d{2})'),
+    ('short_year_dot', r'(\d{2})\.(\d{1,2})\.(\d{1,2})'),
+    ('dot_long', r'(\d{1,2})\.(\d{1,2})\.(\d{4})'),
+    ('dot_short', r'(\d{1,2})\.(\d{1,2})\.(\d{2})'),
+    ('compact_long', r'(\d{4})(\d{2})(\d{2})'),
+    ('compact_short', r'(\d{2})(\d{2})(\d{2})'),
+    ('month_comma', _MONTH + r'[^\S\n]+(\d{1,2}),[^\S\n]+(\d{4})'),
+    ('month_space', _MONTH + r'[^\S\n]+(\d{1,2})[^\S\n]+(\d{4})'),
+    ('day_month', r'(\d{1,2})-' + _MONTH + r'-(\d{4})'),
+)
+# All shapes in one alternation: a single engine call per date, dispatched on match.lastgroup
+_DATE_RE = re.compile('|'.join(f'(?P<{name}>{body})' for name, body in _DATE_ALTS))
+# Index of each branch group; its three parts are the next three groups
+_DATE_BRANCH_INDEX = dict(_DATE_RE.groupindex)
+
+
+_DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _valid_ymd(year, month, day):
+    """Check that year/month/day form a real calendar date (same range as datetime)."""
+    if not (1 <= year <= 9999 and 1 <= month <= 12 and day >= 1):
+        return False
+    leap_day = month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    return day <= _DAYS_IN_MONTH[month] + leap_day
+
+
+# Readings of each branch as (year, month, day), tried in order until one is a real date
+# (e.g. 25/12/2024 is not a valid MM/DD/YYYY date, so it is read as DD/MM/YYYY).
+# Listed month-first; _readings_for_locale reorders them for day-first locales.
+_DATE_READINGS = {
+    'slash_long': (('MM/DD/YYYY', lambda a, b, c: (int(c), int(a), int(b))),
+                   ('DD/MM/YYYY', lambda a, b, c: (int(c), int(b), int(a)))),
+    'slash_short': (('MM/DD/YY', lambda a, b, c: (2000 + int(c), int(a), int(b))),
+                    ('DD/MM/YY', lambda a, b, c: (2000 + int(c), int(b), int(a)))),
+    'dash_long': (('MM-DD-YYYY', lambda a, b, c: (int(c), int(a), int(b))),
+                  ('DD-MM-YYYY', lambda a, b, c: (int(c), int(b), int(a)))),
+    'dash_short': (('MM-DD-YY', lambda a, b, c: (2000 + int(c), int(a), int(b))),
+                   ('DD-MM-YY', lambda a, b, c: (2000 + int(c), int(b), int(a)))),
+    'year_slash': (('YYYY/MM/DD', lambda a, b, c: (int(a), int(b), int(c))),),
+    'year_dot': (('YYYY.MM.DD', lambda a, b, c: (int(a), int(b), int(c))),),
+    'dot_ambiguous': (('YY.MM.DD', lambda a, b, c: (2000 + int(a), int(b), int(c))),
+                      ('MM.DD.YY', lambda a, b, c: (2000 + int(c), int(a), int(b))),
+                      ('DD.MM.YY', lambda a, b, c: (2000 + int(c), int(b), int(a)))),
+    'short_year_dot': (('YY.MM.DD', lambda a, b, c: (2000 + int(a), int(b), int(c))),),
+    'dot_long': (('MM.DD.YYYY', lambda a, b, c: (int(c), int(a), int(b))),
+                 ('DD.MM.YYYY', lambda a, b, c: (int(c), int(b), int(a)))),
+    'dot_short': (('MM.DD.YY', lambda a, b, c: (2000 + int(c), int(a), int(b))),
+                  ('DD.MM.YY', lambda a, b, c: (2000 + int(c), int(b), int(a)))),
+    'compact_long': (('YYYYMMDD', lambda a, b, c: (int(a), int(b), int(c))),),
+    'compact_short': (('YYMMDD', lambda a, b, c: (2000 + int(a), int(b), int(c))),),
+    'month_comma': (('Month DD, YYYY', lambda a, b, c: (int(c), _MONTH_NUMBER[a], int(b))),),
+    'month_space': (('Month DD YYYY', lambda a, b, c: (int(c), _MONTH_NUMBER[a], int(b))),),
+    'day_month': (('DD-Month-YYYY', lambda a, b, c: (int(c), _MONTH_NUMBER[b], int(a))),),
+}
+
+
+def _readings_for_locale(readings, locale):
+    """Order each branch's readings for a locale: 'us' tries MM/DD first, 'eu' tries DD/MM first."""
+    if locale != 'eu':
+        return readings
+    return {branch: tuple(sorted(options, key=lambda option: option[0].startswith('MM')))
+            for branch, options in readings.items()}
+
+
+_DATE_READINGS = _readings_for_locale(_DATE_READINGS, DATE_LOCALE)
+
+# Changelog headings whose whole date is a supported non-ISO shape, for one-pass rewriting
+_CHANGELOG_DATE_SUB_RE = _re_impl.compile(
+    r'(?m)(## \[[0-9]+\.[0-9]+\.[0-9]+\] - )[^\S\n]*(?:' + _DATE_RE.pattern + r')[^\S\n]*$'
+)
+_CHANGELOG_DATE_BRANCH_INDEX = dict(_CHANGELOG_DATE_SUB_RE.groupindex)
+
+
+def _read_date(branch, parts):
+    """Return (normalized_date, original_format) for the first valid reading of a matched branch, or None."""
+    for format_name, reading in _DATE_READINGS[branch]:
+        year, month, day = reading(*parts)
+        if _valid_ymd(year, month, day):
+            return f"{year:04d}-{month:02d}-{day:02d}", format_name
+    return None
+
 
+# Read-only views of the compiled patterns, for integrations that want to reuse them
+METADATA_PATTERNS = MappingProxyType({
+    'field': _METADATA_FIELD_RE,
+    'heading': _HEADING_RE,
+})
+DATE_PATTERNS = MappingProxyType({
+    'iso_date': ISO_DATE_RE,
+    'strict_iso_date': _STRICT_ISO_DATE_RE,
+    'date': _DATE_RE,
+})
+CHANGELOG_PATTERNS = MappingProxyType({
+    'date_heading': _CHANGELOG_DATE_HEADING_RE,
+    'date_heading_sub': _CHANGELOG_DATE_SUB_RE,
+    'section': _CHANGELOG_SECTION_RE,
+})
+
+
+@functools.lru_cache(maxsize=4096)
 def normalize_date_format(date_str):
     """
     Convert various date formats to YYYY-MM-DD.
     Returns (normalized_date, was_changed, original_format)
+    Results are memoized, since the same few dates recur across files and changelog entries.
     """
     if not date_str:
         return None, False, None
     
-    # Already in correct format
-    if re.fullmatch(ISO_DATE_PATTERN, date_str):
+    # Already in correct format; the default ISO pattern is checked with plain string tests
+    if _ISO_FAST_PATH:
+        is_iso = (len(date_str) == 10 and date_str[4] == '-' and date_str[7] == '-'
+                  and date_str[:4].isdecimal() and date_str[5:7].isdecimal() and date_str[8:].isdecimal())
+    else:
+        is_iso = ISO_DATE_RE.fullmatch(date_str)
+    if is_iso:
         return date_str, False, 'YYYY-MM-DD'
     
-    # Common date format patterns
-    patterns = [
-        # MM/DD/YYYY
-        (r'(\d{1,2})/(\d{1,2})/(\d{4})', lambda m: f"{m.group(3)}-{m.group(1).zfill(2)}-{m.group(2).zfill(2)}"),
-        # MM/DD/YY (2-digit year)
-        (r'(\d{1,2})/(\d{1,2})/(\d{2})', lambda m: f"20{m.group(3)}-{m.group(1).zfill(2)}-{m.group(2).zfill(2)}"),
-        # DD/MM/YYYY
-        (r'(\d{1,2})/(\d{1,2})/(\d{4})', lambda m: f"{m.group(3)}-{m.group(2).zfill(2)}-{m.group(1).zfill(2)}"),
-        # DD/MM/YY (2-digit year)
-        (r'(\d{1,2})/(\d{1,2})/(\d{2})', lambda m: f"20{m.group(3)}-{m.group(2).zfill(2)}-{m.group(1).zfill(2)}"),
-        # MM-DD-YYYY
-        (r'(\d{1,2})-(\d{1,2})-(\d{4})', lambda m: f"{m.group(3)}-{m.group(1).zfill(2)}-{m.group(2).zfill(2)}"),
-        # MM-DD-YY (2-digit year)
-        (r'(\d{1,2})-(\d{1,2})-(\d{2})', lambda m: f"20{m.group(3)}-{m.group(1).zfill(2)}-{m.group(2).zfill(2)}"),
-        # DD-MM-YYYY
-        (r'(\d{1,2})-(\d{1,2})-(\d{4})', lambda m: f"{m.group(3)}-{m.group(2).zfill(2)}-{m.group(1).zfill(2)}"),
-        # DD-MM-YY (2-digit year)
-        (r'(\d{1,2})-(\d{1,2})-(\d{2})', lambda m: f"20{m.group(3)}-{m.group(2).zfill(2)}-{m.group(1).zfill(2)}"),
-        # YYYY/MM/DD
-        (r'(\d{4})/(\d{1,2})/(\d{1,2})', lambda m: f"{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}"),
-        # YYYY.MM.DD (ISO-like with dots)
-        (r'(\d{4})\.(\d{1,2})\.(\d{1,2})', lambda m: f"{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}"),
-        # YYYY.MM.DD (2-digit year variant)
-        (r'(\d{2})\.(\d{1,2})\.(\d{1,2})', lambda m: f"20{m.group(1)}-{m.group(2).zfill(2)}-{m.group(3).zfill(2)}"),
-        # MM.DD.YYYY
-        (r'(\d{1,2})\.(\d{1,2})\.(\d{4})', lambda m: f"{m.group(3)}-{m.group(1).zfill(2)}-{m.group(2).zfill(2)}"),
-        # MM.DD.YY (2-digit year)
-        (r'(\d{1,2})\.(\d{1,2})\.(\d{2})', lambda m: f"20{m.group(3)}-{m.group(1).zfill(2)}-{m.group(2).zfill(2)}"),
-        # DD.MM.YYYY
-        (r'(\d{1,2})\.(\d{1,2})\.(\d{4})', lambda m: f"{m.group(3)}-{m.group(2).zfill(2)}-{m.group(1).zfill(2)}"),
-        # DD.MM.YY (2-digit year)
-        (r'(\d{1,2})\.(\d{1,2})\.(\d{2})', lambda m: f"20{m.group(3)}-{m.group(2).zfill(2)}-{m.group(1).zfill(2)}"),
-        # Compact formats (YYYYMMDD, YYMMDD)
-        (r'(\d{4})(\d{2})(\d{2})', lambda m: f"{m.group(1)}-{m.group(2)}-{m.group(3)}"),
-        (r'(\d{2})(\d{2})(\d{2})', lambda m: f"20{m.group(1)}-{m.group(2)}-{m.group(3)}"),
-        # US format with month names (abbreviated and full)
-        (r'(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+(\d{1,2}),?\s+(\d{4})', 
-         lambda m: f"{m.group(3)}-{str(['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec'].index(m.group(1))+1).zfill(2)}-{m.group(2).zfill(2)}"),
-        (r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+(\d{1,2}),?\s+(\d{4})', 
-         lambda m: f"{m.group(3)}-{str(['January','February','March','April','May','June','July','August','September','October','November','December'].index(m.group(1))+1).zfill(2)}-{m.group(2).zfill(2)}"),
-        # NEW: DD-Mon-YYYY and DD-Month-YYYY
-        (r'(\d{1,2})-(Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)-(\d{4})',
-         lambda m: f"{m.group(3)}-{str(['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec'].index(m.group(2))+1).zfill(2)}-{m.group(1).zfill(2)}"),
-        (r'(\d{1,2})-(January|February|March|April|May|June|July|August|September|October|November|December)-(\d{4})',
-         lambda m: f"{m.group(3)}-{str(['January','February','March','April','May','June','July','August','September','October','November','December'].index(m.group(2))+1).zfill(2)}-{m.group(1).zfill(2)}"),
-    ]
-    
-    for pattern, formatter in patterns:
-        match = re.fullmatch(pattern, date_str)
-        if match:
-            try:
-                normalized = formatter(match)
-                # Validate the normalized date
-                datetime.strptime(normalized, '%Y-%m-%d')
-                return normalized, True, pattern
-            except ValueError:
-                continue
+    match = _DATE_RE.fullmatch(date_str)
+    if match:
+        branch = match.lastgroup
+        index = _DATE_BRANCH_INDEX[branch]
+        result = _read_date(branch, match.group(index + 1, index + 2, index + 3))
+        if result:
+            return result[0], True, result[1]
     
     return date_str, False, 'unknown'
 
 
+def _norm_cache_clear():
+    """Clear the normalize_date_format memo (used by tests)."""
+    normalize_date_format.cache_clear()
+
+
 def confirm_date_interpretation(original_date, normalized_date, original_format):
     """Ask user to confirm date interpretation when format is ambiguous."""
     prompt = (
@@ -139,8 +274,7 @@ def confirm_date_interpretation(original_date, normalized_date, original_format)
         f"Is this correct? [Y/n]: "
     )
     
-    timeout_input = TimeoutInput(INITIAL_TIMEOUT, GENTLE_PROMPT_DELAY, FINAL_TIMEOUT)
-    resp = timeout_input.get_input_with_timeout(prompt)
+    resp = _TIMEOUT_INPUT.get_input_with_timeout(prompt)
     
     if resp is None:
         print("Timeout reached. Using original date as-is.")
@@ -160,6 +294,44 @@ class TimeoutInput:
         self.user_input = None
         self.input_received = threading.Event()
     
+    def reset(self):
+        """Clear the answer from the previous prompt so the instance can be reused."""
+        self.user_input = None
+        self.input_received.clear()
+    
+    @staticmethod
+    def _stdin_is_selectable():
+        """A POSIX terminal delivers whole lines, so stdin can be polled without a helper thread."""
+        if os.name != 'posix':
+            return False
+        try:
+            return sys.stdin.isatty()
+        except (AttributeError, ValueError):
+            return False
+    
+    def _print_gentle_prompt(self):
+        print("\n🤔 Are you there? Still waiting for your response...")
+        print("(You can type 'Y' and press Enter to continue, or 'N' to skip)")
+    
+    def _print_timeout(self):
+        print(f"\n⏰ Timeout reached after {self.initial_timeout} seconds.")
+        print("No response received. Exiting gracefully...")
+    
+    def _select_input(self, prompt):
+        """Wait for a line on a terminal stdin with selectors; returns None on timeout or EOF."""
+        print(prompt, end='', flush=True)
+        with selectors.DefaultSelector() as selector:
+            selector.register(sys.stdin, selectors.EVENT_READ)
+            if not selector.select(self.gentle_delay):
+                self._print_gentle_prompt()
+                if not selector.select(self.final_timeout):
+                    self._print_timeout()
+                    return None
+        line = sys.stdin.readline()
+        if not line:
+            return None
+        return line.rstrip('\n')
+    
     def _input_thread(self, prompt):
         """Thread function to get user input."""
         try:
@@ -170,6 +342,7 @@ class TimeoutInput:
     
     def get_input_with_timeout(self, prompt):
         """Get user input with timeout and gentle prompts."""
+        self.reset()
         # If timeouts are disabled (None), use regular input
         if self.initial_timeout is None:
             try:
@@ -177,7 +350,10 @@ class TimeoutInput:
             except (EOFError, KeyboardInterrupt):
                 return None
         
-        # Start input thread
+        if self._stdin_is_selectable():
+            return self._select_input(prompt)
+        
+        # Start input thread (stdin cannot be polled, e.g. Windows consoles or pipes)
         input_thread = threading.Thread(target=self._input_thread, args=(prompt,))
         input_thread.daemon = True
         input_thread.start()
@@ -187,45 +363,59 @@ class TimeoutInput:
             return self.user_input
         
         # Gentle prompt
-        print("\n🤔 Are you there? Still waiting for your response...")
-        print("(You can type 'Y' and press Enter to continue, or 'N' to skip)")
+        self._print_gentle_prompt()
         
         # Wait for final timeout
         if self.input_received.wait(self.final_timeout):
             return self.user_input
         
         # Final timeout reached
-        print(f"\n⏰ Timeout reached after {self.initial_timeout} seconds.")
-        print("No response received. Exiting gracefully...")
+        self._print_timeout()
         return None
 
 
+# Shared by every prompt; get_input_with_timeout() resets it between uses
+_TIMEOUT_INPUT = TimeoutInput(INITIAL_TIMEOUT, GENTLE_PROMPT_DELAY, FINAL_TIMEOUT)
+
+
 def extract_metadata_block(lines):
-    in_block = False
-    metadata = {}
-    block_start = block_end = None
-    for idx, line in enumerate(lines):
-        if line.strip().startswith('---'):
-            if not in_block:
-                block_start = idx
-            else:
-                block_end = idx
-            in_block = not in_block
-            continue
-        if in_block and line.strip().startswith('- **'):
-            match = re.match(r'- \*\*(.+?):\*\* (.+)', line.strip())
-            if match:
-                key, value = match.groups()
-                metadata[key.strip()] = value.strip()
-            else:
-                # Handle empty values (no content after colon and space)
-                match = re.match(r'- \*\*(.+?):\*\*$', line.strip())
-                if match:
-                    key = match.group(1)
-                    metadata[key.strip()] = ''
+    metadata, block_start, block_end, _ = _scan_header(lines, find_heading=False)
     return metadata, block_start, block_end
 
 
+def extract_metadata_block_from_path(path):
+    """
+    Extract the metadata block straight from a file, reading only up to the closing '---'.
+    Large files are memory-mapped so the body after the block is never read or decoded.
+    Returns (metadata, block_start, block_end) like extract_metadata_block.
+    """
+    return extract_metadata_block(_read_header_lines(path))
+
+
+def _read_header_lines(path):
+    """
+    Read a file's lines up to and including the second '---' line (or to EOF if there is none).
+    Lines are split on LF only, so CRLF endings are kept and a bare CR does not split a line.
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < mmap.PAGESIZE:
+            # Small (or empty, which cannot be mapped) files: a plain read is cheaper
+            source = io.BytesIO(f.read())
+        else:
+            source = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with source:
+            header = []
+            markers = 0
+            for raw_line in iter(source.readline, b''):
+                line = raw_line.decode('utf-8')
+                header.append(line)
+                if line.strip().startswith('---'):
+                    markers += 1
+                    if markers == 2:
+                        break
+    return header
+
+
 def validate_metadata(metadata):
     errors = []
     for field in REQUIRED_FIELDS:
@@ -234,13 +424,13 @@ def validate_metadata(metadata):
     # Date checks
     for date_field in ['Created', 'Last Updated']:
         if date_field in metadata:
-            if not re.fullmatch(ISO_DATE_PATTERN, metadata[date_field]):
+            if not ISO_DATE_RE.fullmatch(metadata[date_field]):
                 errors.append(f"{date_field} is not in ISO 8601 format (YYYY-MM-DD): {metadata[date_field]}")
     return errors
 
 
 def prompt_autofill(field_name, current_value=None):
-    today = datetime.now().strftime('%Y-%m-%d')
+    today = date.today().isoformat()
     if current_value:
         prompt = (
             f"Field '{field_name}' has invalid value '{current_value}'. "
@@ -253,8 +443,7 @@ def prompt_autofill(field_name, current_value=None):
             f"\n(Type Y and press Enter to accept, or N to skip and update manually.)\n"
         )
     
-    timeout_input = TimeoutInput(INITIAL_TIMEOUT, GENTLE_PROMPT_DELAY, FINAL_TIMEOUT)
-    resp = timeout_input.get_input_with_timeout(prompt)
+    resp = _TIMEOUT_INPUT.get_input_with_timeout(prompt)
     
     if resp is None:
         print(f"Timeout reached for '{field_name}'. Skipping auto-fill.")
@@ -286,7 +475,7 @@ def display_metadata(metadata):
 
 def wait_for_user_exit():
     """Wait for user input before exiting to prevent window from closing."""
-    print("\n" + "="*60)
+    print(SEPN)
     print("✅ Validation complete!")
     print("Press Enter to exit...")
     try:
@@ -295,88 +484,298 @@ def wait_for_user_exit():
         pass
 
 
+def _heading_text(line):
+    """Return the text of a markdown heading line (e.g., '# Title' -> 'Title'), or None."""
+    # Cheap C-level prefilter; only lines containing '#' can be headings
+    if '#' not in line:
+        return None
+    # Hand-parsed equivalent of _HEADING_RE: one or more '#', whitespace, then the text
+    stripped = line.strip()
+    if stripped[:1] != '#':
+        return None
+    text = stripped.lstrip('#')
+    if text[:1].isspace():
+        return text.strip()
+    return None
+
+
 def extract_first_heading(lines, metadata_block_end):
     """
     Extract the first markdown heading (e.g., # Title) after the metadata block.
     Returns the heading text, or None if not found.
     """
-    for idx, line in enumerate(lines):
-        if idx <= metadata_block_end:
-            continue
-        match = re.match(r'#+\s+(.+)', line.strip())
-        if match:
-            return match.group(1).strip()
+    for line in lines[metadata_block_end + 1:]:
+        heading = _heading_text(line)
+        if heading is not None:
+            return heading
     return None
 
 
+def header_scan(lines):
+    """
+    Extract the metadata block and the first heading after it in a single pass over lines.
+    Returns (metadata, block_start, block_end, first_heading), matching extract_metadata_block
+    followed by extract_first_heading (which searches from the top when the block is not closed).
+    """
+    return _scan_header(lines, find_heading=True)
+
+
+def _scan_header(lines, find_heading):
+    """
+    The metadata block parser behind extract_metadata_block and header_scan.
+    first_heading is only looked for (and otherwise None) when find_heading is set.
+    """
+    metadata = {}
+    block_start = block_end = None
+    # First heading seen before the block closes; only the answer if it never does
+    early_heading = None
+    numbered = enumerate(lines)
+    for idx, line in numbered:
+        stripped = line.strip()
+        if stripped.startswith('---'):
+            if block_start is not None:
+                # Block closed; later '---' lines are horizontal rules, not metadata
+                block_end = idx
+                break
+            block_start = idx
+            continue
+        if block_start is not None and stripped[:4] == '- **':
+            match = _METADATA_FIELD_RE.match(stripped)
+            if match:
+                key, value = match.groups()
+                # value is None for empty fields (nothing after the colon)
+                metadata[key.strip()] = value.strip() if value else ''
+        elif find_heading and early_heading is None:
+            early_heading = _heading_text(line)
+    if block_end is None or not find_heading:
+        return metadata, block_start, block_end, early_heading
+    # Block closed: keep walking the same iterator up to the first heading
+    for idx, line in numbered:
+        heading = _heading_text(line)
+        if heading is not None:
+            return metadata, block_start, block_end, heading
+    return metadata, block_start, block_end, None
+
+
+# Underscores and hyphens become spaces in one translate() pass
+_TITLE_TRANS = str.maketrans('_-', '  ')
+
+
 def prettify_filename(filename):
     """
     Convert filename to a human-friendly title (e.g., 'my_file_name.md' -> 'My File Name').
     """
     name = os.path.splitext(os.path.basename(filename))[0]
-    name = name.replace('_', ' ').replace('-', ' ')
-    return name.title()
+    return name.translate(_TITLE_TRANS).title()
 
 
-def find_changelog_file(directory):
-    """Find changelog file in the given directory."""
-    changelog_files = ['CHANGELOG.md', 'changelog.md', 'Changelog.md']
-    for filename in changelog_files:
+@functools.lru_cache(maxsize=256)
+def _changelog_in_dir(directory, mtime_ns):
+    """List a directory once and return its changelog path (memoized per directory mtime)."""
+    try:
+        with os.scandir(directory) as entries:
+            names = {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return None
+    for filename in CHANGELOG_FILENAMES:
+        if filename in names:
+            return os.path.join(directory, filename)
+    # No exact match: case-insensitive filesystems (macOS, Windows) still resolve e.g. ChangeLog.md
+    for filename in CHANGELOG_FILENAMES:
         filepath = os.path.join(directory, filename)
         if os.path.exists(filepath):
             return filepath
     return None
 
 
+def find_changelog_file(directory):
+    """
+    Find changelog file in the given directory.
+    Results are cached per directory until its contents change (the directory mtime moves).
+    """
+    try:
+        mtime_ns = os.stat(directory).st_mtime_ns
+    except OSError:
+        return None
+    return _changelog_in_dir(directory, mtime_ns)
+
+
+def find_changelog_files(paths):
+    """
+    Find the changelog for each markdown file in paths.
+    Returns a dict mapping each path to its directory's changelog path (or None);
+    every directory is resolved at most once no matter how many files it holds.
+    """
+    by_dir = {}
+    found = {}
+    for path in paths:
+        directory = os.path.dirname(path) or os.curdir
+        if directory not in by_dir:
+            by_dir[directory] = find_changelog_file(directory)
+        found[path] = by_dir[directory]
+    return found
+
+
+_cache_connection = None
+_cache_pid = None
+
+
+def _get_cache_connection():
+    """Open (once per process) the sqlite parse cache configured in CACHE_CONFIG."""
+    global _cache_connection, _cache_pid
+    if _cache_connection is None or _cache_pid != os.getpid():
+        import sqlite3
+        connection = sqlite3.connect(CACHE_CONFIG.get('path') or '.mdv_cache.sqlite', timeout=5)
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS files '
+            '(path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER, digest TEXT)'
+        )
+        connection.execute(
+            'CREATE TABLE IF NOT EXISTS results '
+            '(func TEXT, digest TEXT, result TEXT, PRIMARY KEY (func, digest))'
+        )
+        _cache_connection, _cache_pid = connection, os.getpid()
+    return _cache_connection
+
+
+def _file_digest(connection, path):
+    """
+    Return the BLAKE2 content digest of path.
+    Unchanged files (same mtime and size as last run) skip the read and hash entirely.
+    """
+    stat_result = os.stat(path)
+    key = os.path.abspath(path)
+    row = connection.execute(
+        'SELECT mtime_ns, size, digest FROM files WHERE path = ?', (key,)
+    ).fetchone()
+    if row and row[0] == stat_result.st_mtime_ns and row[1] == stat_result.st_size:
+        return row[2]
+    import hashlib
+    with open(path, 'rb') as f:
+        digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+    connection.execute(
+        'INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)',
+        (key, stat_result.st_mtime_ns, stat_result.st_size, digest)
+    )
+    return digest
+
+
+def _disk_memo(func):
+    """
+    Cache the result of a single-file parser across runs when the parse cache is enabled.
+    Results are stored as JSON keyed by (function name, content digest).
+    """
+    @functools.wraps(func)
+    def wrapper(path):
+        if not CACHE_CONFIG.get('enabled'):
+            return func(path)
+        # The cache is off by default, so its modules are only imported once it is used
+        import json
+        import sqlite3
+        try:
+            connection = _get_cache_connection()
+            digest = _file_digest(connection, path)
+            row = connection.execute(
+                'SELECT result FROM results WHERE func = ? AND digest = ?', (func.__name__, digest)
+            ).fetchone()
+            if row:
+                connection.commit()
+                return json.loads(row[0])
+        except (OSError, sqlite3.Error):
+            # Unreadable file or unusable cache: parse directly
+            return func(path)
+        result = func(path)
+        try:
+            connection.execute(
+                'INSERT OR REPLACE INTO results VALUES (?, ?, ?)',
+                (func.__name__, digest, json.dumps(result))
+            )
+            connection.commit()
+        except sqlite3.Error:
+            pass
+        return result
+    return wrapper
+
+
+@functools.lru_cache(maxsize=64)
+def _load_text_cached(path, mtime_ns, size):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def _load_text(path, stat_result=None):
+    """
+    Read a UTF-8 text file once and reuse the content while its mtime and size are unchanged.
+    Callers that already stat'ed the file can pass the result in.
+    Writers in this module clear the cache with _clear_text_caches().
+    """
+    if stat_result is None:
+        try:
+            stat_result = os.stat(path)
+        except OSError:
+            # Not stat-able: read directly so the caller sees the usual open() error
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+    return _load_text_cached(path, stat_result.st_mtime_ns, stat_result.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_text_cached(parser, path, mtime_ns, size):
+    return parser(_load_text_cached(path, mtime_ns, size))
+
+
+def _parse_file(parser, path):
+    """
+    Apply a text parser to a file, reusing the result while the file's mtime and size are unchanged.
+    Sibling files in a batch share one changelog, so it is parsed once rather than once per file.
+    """
+    try:
+        stat_result = os.stat(path)
+    except OSError:
+        return parser(_load_text(path))
+    return _parse_text_cached(parser, path, stat_result.st_mtime_ns, stat_result.st_size)
+
+
+def _clear_text_caches():
+    """Forget cached file contents and parse results after this module writes a file."""
+    _load_text_cached.cache_clear()
+    _parse_text_cached.cache_clear()
+
+
+def _extract_changelog_section_from_text(text):
+    """Extract the changelog section from markdown text, stopping at the next top-level section."""
+    lines = io.StringIO(text)
+    # Find the start of the changelog section
+    for line in lines:
+        if _CHANGELOG_SECTION_RE.match(line.strip()):
+            break
+    else:
+        return None
+    # Collect all lines until the next top-level section (e.g., #, ## not part of a version heading) or end of file
+    changelog_lines = []
+    for line in lines:
+        if _TOP_SECTION_RE.match(line) and not _VERSION_SECTION_RE.match(line):
+            break
+        changelog_lines.append(line.rstrip('\n'))
+    return '\n'.join(changelog_lines).strip()
+
+
+@_disk_memo
 def extract_changelog_section_from_file(file_path):
     """Extract changelog section from within a markdown file, capturing all version entries until the next top-level section or end of file."""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # Find the start of the changelog section
-        changelog_start = None
-        for i, line in enumerate(lines):
-            if re.match(r'^#{1,4} +Changelog *$', line.strip(), re.IGNORECASE) or \
-               re.match(r'^## +History *$', line.strip(), re.IGNORECASE) or \
-               re.match(r'^## +Version History *$', line.strip(), re.IGNORECASE):
-                changelog_start = i
-                break
-        if changelog_start is None:
-            return None
-        # Collect all lines until the next top-level section (e.g., #, ## not part of a version heading) or end of file
-        changelog_lines = []
-        for line in lines[changelog_start+1:]:
-            if re.match(r'^#{1,2} +[^\[]', line) and not re.match(r'^## +\[', line):
-                break
-            changelog_lines.append(line.rstrip('\n'))
-        return '\n'.join(changelog_lines).strip()
+        return _extract_changelog_section_from_text(_load_text(file_path))
     except Exception as e:
         print(f"⚠️  Warning: Could not read file {file_path}: {e}")
         return None
 
 
-def suggest_changelog_placement(file_path, document_type=None):
-    """
-    Suggest optimal changelog placement based on document type and content.
-    Returns placement recommendation and example structure.
-    """
-    if not document_type:
-        filename = os.path.basename(file_path).lower()
-        if filename in ['readme.md', 'readme.txt']:
-            document_type = 'readme'
-        elif any(keyword in filename for keyword in ['api', 'reference', 'docs/']):
-            document_type = 'documentation'
-        elif any(keyword in filename for keyword in ['config', 'setup', 'install']):
-            document_type = 'configuration'
-        else:
-            document_type = 'general'
-    
-    placement_guide = {
-        'readme': {
-            'position': 'Near the end, before License/Contact sections',
-            'heading_level': '##',
-            'example': """## Changelog
+# Changelog placement recommendation and example structure for each document type
+_PLACEMENT_GUIDE = {
+    'readme': {
+        'position': 'Near the end, before License/Contact sections',
+        'heading_level': '##',
+        'example': """## Changelog
 
 ## [1.1.0] - 2025-07-05
 ### Added
@@ -390,11 +789,11 @@ def suggest_changelog_placement(file_path, document_type=None):
 
 ## License
 MIT License"""
-        },
-        'documentation': {
-            'position': 'At the end, as a reference section',
-            'heading_level': '##',
-            'example': """## Changelog
+    },
+    'documentation': {
+        'position': 'At the end, as a reference section',
+        'heading_level': '##',
+        'example': """## Changelog
 
 ## [2.0.0] - 2025-07-05
 ### Changed
@@ -403,42 +802,66 @@ MIT License"""
 ## [1.5.0] - 2025-06-01
 ### Added
 - New features"""
-        },
-        'configuration': {
-            'position': 'At the very end, as a footer',
-            'heading_level': '##',
-            'example': """---
+    },
+    'configuration': {
+        'position': 'At the very end, as a footer',
+        'heading_level': '##',
+        'example': """---
 
 ## Changelog
 
 ## [1.2.0] - 2025-07-05
 ### Added
 - New configuration options"""
-        },
-        'general': {
-            'position': 'Near the end, before any appendices',
-            'heading_level': '##',
-            'example': """## Changelog
+    },
+    'general': {
+        'position': 'Near the end, before any appendices',
+        'heading_level': '##',
+        'example': """## Changelog
 
 ## [1.0.0] - 2025-07-05
 ### Added
 - Initial features"""
-        }
     }
+}
+
+
+def suggest_changelog_placement(file_path, document_type=None):
+    """
+    Suggest optimal changelog placement based on document type and content.
+    Returns placement recommendation and example structure.
+    """
+    if not document_type:
+        filename = os.path.basename(file_path).lower()
+        if filename in ['readme.md', 'readme.txt']:
+            document_type = 'readme'
+        elif any(keyword in filename for keyword in ['api', 'reference', 'docs/']):
+            document_type = 'documentation'
+        elif any(keyword in filename for keyword in ['config', 'setup', 'install']):
+            document_type = 'configuration'
+        else:
+            document_type = 'general'
     
-    return placement_guide.get(document_type, placement_guide['general'])
+    # Copy so callers cannot modify the shared guide
+    return dict(_PLACEMENT_GUIDE.get(document_type, _PLACEMENT_GUIDE['general']))
+
 
+_UNSET = object()
 
-def determine_changelog_preference(file_path, directory):
+
+def determine_changelog_preference(file_path, directory, separate_changelog=_UNSET, embedded_changelog=_UNSET):
     """
     Determine whether to prefer separate CHANGELOG.md or embedded changelog section.
+    Callers that already looked up the changelogs can pass them in to skip rediscovery.
     Returns: 'separate', 'embedded', or 'both'
     """
     # Check if separate changelog file exists
-    separate_changelog = find_changelog_file(directory)
+    if separate_changelog is _UNSET:
+        separate_changelog = find_changelog_file(directory)
     
     # Check if current file has embedded changelog
-    embedded_changelog = extract_changelog_section_from_file(file_path)
+    if embedded_changelog is _UNSET:
+        embedded_changelog = extract_changelog_section_from_file(file_path)
     
     # Determine file type and context
     filename = os.path.basename(file_path).lower()
@@ -463,38 +886,59 @@ def determine_changelog_preference(file_path, directory):
         return 'both'  # No changelog found, suggest both options
 
 
+def _extract_latest_version_from_text(text):
+    """Extract the latest version from changelog text, keeping a running max."""
+    latest_version = None
+    latest_key = (-1, -1, -1)
+    for match in _VERSION_RE.finditer(text):
+        parts = match.group(1, 2, 3) if match.group(1) else match.group(4, 5, 6)
+        key = (int(parts[0]), int(parts[1]), int(parts[2]))
+        if key > latest_key:
+            latest_key = key
+            latest_version = '.'.join(parts)
+    return latest_version
+
+
+@_disk_memo
 def extract_latest_version_from_changelog(changelog_path):
     """Extract the latest version from a changelog file."""
     try:
-        with open(changelog_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Look for version patterns like [1.0.0] or ## [1.0.0]
-        version_patterns = [
-            r'## \[([0-9]+\.[0-9]+\.[0-9]+)\]',  # ## [1.0.0]
-            r'\[([0-9]+\.[0-9]+\.[0-9]+)\]',     # [1.0.0]
-            r'## ([0-9]+\.[0-9]+\.[0-9]+)',      # ## 1.0.0
-        ]
-        
-        all_versions = []
-        for pattern in version_patterns:
-            matches = re.findall(pattern, content)
-            all_versions.extend(matches)
-        
-        if all_versions:
-            # Sort versions and return the latest (highest)
-            def version_key(version):
-                return tuple(map(int, version.split('.')))
-            
-            latest_version = max(all_versions, key=version_key)
-            return latest_version
-        
-        return None
+        return _parse_file(_extract_latest_version_from_text, changelog_path)
     except Exception as e:
         print(f"⚠️  Warning: Could not read changelog file {changelog_path}: {e}")
         return None
 
 
+def _normalize_changelog_dates_from_text(content):
+    """
+    Normalize the dates in changelog headings of content to YYYY-MM-DD.
+    Returns (new_content, changes_made).
+    """
+    # Cheap C-level pre-check: nothing to normalize without version headings
+    if _CHANGELOG_HEADING_MARKER not in content:
+        return content, False
+
+    changes_made = False
+    pieces = []
+    position = 0
+    # Only headings with a supported non-ISO date match; the branch name picks the reading
+    for match in _CHANGELOG_DATE_SUB_RE.finditer(content):
+        branch = match.lastgroup
+        index = _CHANGELOG_DATE_BRANCH_INDEX[branch]
+        result = _read_date(branch, match.group(index + 1, index + 2, index + 3))
+        if not result:
+            continue
+        original_date = match.group(index)
+        normalized = result[0]
+        changes_made = True
+        print(f"🔄 Normalizing changelog date: '{original_date}' → '{normalized}'")
+        pieces.append(content[position:match.start()])
+        pieces.append(match.group(1) + normalized)
+        position = match.end()
+    pieces.append(content[position:])
+    return ''.join(pieces), changes_made
+
+
 def normalize_changelog_dates(changelog_path, auto_fix=False):
     """
     Normalize all dates in changelog headings to YYYY-MM-DD format.
@@ -502,30 +946,12 @@ def normalize_changelog_dates(changelog_path, auto_fix=False):
     Returns True if changes were made, False otherwise.
     """
     try:
-        with open(changelog_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Regex to match headings like: ## [1.2.0] - <date>
-        pattern = r'(## \[[0-9]+\.[0-9]+\.[0-9]+\] - )(.*)'
-        changes_made = False
-
-        def replacer(match):
-            nonlocal changes_made
-            prefix, date_str = match.groups()
-            original_date = date_str.strip()
-            normalized = normalize_date_format(original_date)
-            
-            if normalized and normalized != original_date:
-                changes_made = True
-                print(f"🔄 Normalizing changelog date: '{original_date}' → '{normalized}'")
-                return f"{prefix}{normalized}"
-            return match.group(0)
-
-        new_content = re.sub(pattern, replacer, content)
+        new_content, changes_made = _normalize_changelog_dates_from_text(_load_text(changelog_path))
 
         if changes_made and auto_fix:
             with open(changelog_path, 'w', encoding='utf-8') as f:
                 f.write(new_content)
+            _clear_text_caches()
             print("✅ Changelog dates normalized in file.")
         elif changes_made:
             print("💡 Suggestion: Update changelog dates to normalized format (use --auto to apply).")
@@ -537,46 +963,53 @@ def normalize_changelog_dates(changelog_path, auto_fix=False):
         return False
 
 
+def _find_invalid_changelog_dates(content):
+    """Return the dates in changelog headings of content that are not YYYY-MM-DD, as a tuple."""
+    # Cheap C-level pre-check: no version headings means no dates to validate
+    if _CHANGELOG_HEADING_MARKER not in content:
+        return ()
+    
+    invalid_dates = []
+    for match in _CHANGELOG_DATE_HEADING_RE.finditer(content):
+        date_str = match.group(2).strip()
+        if not _STRICT_ISO_DATE_RE.fullmatch(date_str):
+            invalid_dates.append(date_str)
+    return tuple(invalid_dates)
+
+
+def _report_invalid_changelog_dates(invalid_dates):
+    """Print any non-standard changelog dates; returns True if there are none."""
+    if invalid_dates:
+        print(f"⚠️  Found {len(invalid_dates)} changelog entries with non-standard date formats:")
+        for invalid_date in invalid_dates:
+            print(f"   • {invalid_date}")
+        print("💡 Use --normalize-dates to convert to YYYY-MM-DD format.")
+        return False
+    
+    return True
+
+
 def validate_changelog_date_format(changelog_path):
     """
     Validate that all dates in changelog headings are in YYYY-MM-DD format.
     Returns True if all dates are properly formatted, False otherwise.
     """
     try:
-        with open(changelog_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-
-        # Regex to match headings like: ## [1.2.0] - <date>
-        pattern = r'## \[[0-9]+\.[0-9]+\.[0-9]+\] - (.*)'
-        matches = re.findall(pattern, content)
-        
-        invalid_dates = []
-        for date_str in matches:
-            date_str = date_str.strip()
-            if not re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
-                invalid_dates.append(date_str)
-        
-        if invalid_dates:
-            print(f"⚠️  Found {len(invalid_dates)} changelog entries with non-standard date formats:")
-            for date in invalid_dates:
-                print(f"   • {date}")
-            print("💡 Use --normalize-dates to convert to YYYY-MM-DD format.")
-            return False
-        
-        return True
-        
+        return _report_invalid_changelog_dates(_parse_file(_find_invalid_changelog_dates, changelog_path))
     except Exception as e:
         print(f"⚠️  Warning: Could not validate changelog dates in {changelog_path}: {e}")
         return False
 
 
-def check_changelog_consistency(metadata_version, file_path, directory):
-    """Check if the metadata version matches the changelog version (separate or embedded)."""
-    # Determine changelog preference for this file
-    preference = determine_changelog_preference(file_path, directory)
-    
+def check_changelog_consistency(metadata_version, file_path, directory, separate_changelog_path=_UNSET, today=None):
+    """
+    Check if the metadata version matches the changelog version (separate or embedded).
+    Callers that already looked up the directory's changelog file can pass it in,
+    and today (YYYY-MM-DD) is used for suggested entries.
+    """
     # Check separate changelog file
-    separate_changelog_path = find_changelog_file(directory)
+    if separate_changelog_path is _UNSET:
+        separate_changelog_path = find_changelog_file(directory)
     separate_version = None
     if separate_changelog_path:
         separate_version = extract_latest_version_from_changelog(separate_changelog_path)
@@ -585,16 +1018,14 @@ def check_changelog_consistency(metadata_version, file_path, directory):
     embedded_changelog_content = extract_changelog_section_from_file(file_path)
     embedded_version = None
     if embedded_changelog_content:
-        # Create a temporary file to use existing extraction logic
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as temp_file:
-            temp_file.write(embedded_changelog_content)
-            temp_file_path = temp_file.name
-        
-        try:
-            embedded_version = extract_latest_version_from_changelog(temp_file_path)
-        finally:
-            os.unlink(temp_file_path)
+        embedded_version = _extract_latest_version_from_text(embedded_changelog_content)
+    
+    # Determine changelog preference for this file from the lookups above
+    preference = determine_changelog_preference(
+        file_path, directory,
+        separate_changelog=separate_changelog_path,
+        embedded_changelog=embedded_changelog_content
+    )
     
     # Determine which version to check based on preference
     if preference == 'separate':
@@ -608,7 +1039,7 @@ def check_changelog_consistency(metadata_version, file_path, directory):
                 print(f"   1. Update your metadata version to {separate_version}, OR")
                 print(f"   2. Add a new changelog entry for version {metadata_version}")
                 print(f"\n📝 Suggested changelog entry:")
-                print(suggest_changelog_entry(metadata_version, "minor"))
+                print(suggest_changelog_entry(metadata_version, "minor", today))
                 return False
             else:
                 print(f"✅ Version consistency verified: {metadata_version} (separate changelog)")
@@ -616,7 +1047,7 @@ def check_changelog_consistency(metadata_version, file_path, directory):
         else:
             print("ℹ️  No separate changelog file found. Consider creating CHANGELOG.md")
             print(f"💡 You can create a CHANGELOG.md file with:")
-            print(suggest_changelog_entry(metadata_version, "initial"))
+            print(suggest_changelog_entry(metadata_version, "initial", today))
             return True
     
     elif preference == 'embedded':
@@ -656,9 +1087,9 @@ def check_changelog_consistency(metadata_version, file_path, directory):
             return True
 
 
-def suggest_changelog_entry(version, changes_type="patch"):
-    """Suggest a changelog entry based on version bump type."""
-    today = datetime.now().strftime('%Y-%m-%d')
+def suggest_changelog_entry(version, changes_type="patch", today=None):
+    """Suggest a changelog entry based on version bump type. today defaults to the current date (YYYY-MM-DD)."""
+    today = today or date.today().isoformat()
     
     if changes_type == "major":
         return f"## [{version}] - {today}\n\n### Changed\n- Breaking changes (describe what changed)\n\n### Added\n- New features (describe additions)\n\n### Removed\n- Removed features (describe removals)\n"
@@ -668,15 +1099,182 @@ def suggest_changelog_entry(version, changes_type="patch"):
         return f"## [{version}] - {today}\n\n### Fixed\n- Bug fixes (describe fixes)\n\n### Changed\n- Minor improvements (describe changes)\n"
 
 
+# Directories never searched for markdown files
+SKIP_DIRS = frozenset({'.git', 'node_modules', '__pycache__', '.venv', 'venv'})
+
+
+def iter_md_files(root, skip=SKIP_DIRS):
+    """
+    Yield the paths of markdown files under root, in the same order as os.walk.
+    Uses os.scandir directly, so directory entries are classified without extra stat calls.
+    """
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                subdirs = []
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    if is_dir:
+                        # Like os.walk, do not descend into symlinked directories
+                        if entry.name not in skip and not entry.is_symlink():
+                            subdirs.append(entry.path)
+                    elif entry.name.endswith('.md'):
+                        yield entry.path
+        except OSError:
+            # Unreadable directory: skip it, as os.walk does
+            continue
+        # Visit subdirectories in listing order (depth-first, like os.walk)
+        stack.extend(reversed(subdirs))
+
+
+def _parse_jobs(flags):
+    """
+    Return the worker process count given by a --jobs=N flag, defaulting to the CPU count.
+    Returns None if N is not a positive integer.
+    """
+    jobs = os.cpu_count() or 1
+    for flag in flags:
+        if flag.startswith('--jobs='):
+            try:
+                jobs = int(flag.partition('=')[2])
+            except ValueError:
+                return None
+            if jobs < 1:
+                return None
+    return jobs
+
+
+def _run_chunk(fn, chunk, args):
+    """Apply fn to each item of a chunk inside a worker process."""
+    return [fn(item, *args) for item in chunk]
+
+
+def _iter_pool_results(executor, fn, items, args=(), chunksize=16, window=8):
+    """
+    Yield fn(item, *args) for each item, in input order, using the executor.
+    Unlike Executor.map, items are consumed lazily: at most `window` chunks are in flight,
+    so discovery keeps overlapping with validation and memory stays bounded.
+    """
+    items = iter(items)
+    pending = deque()
+    try:
+        while True:
+            chunk = list(islice(items, chunksize))
+            if chunk:
+                pending.append(executor.submit(_run_chunk, fn, chunk, args))
+            if pending and (not chunk or len(pending) >= window):
+                yield from pending.popleft().result()
+            elif not chunk:
+                return
+    finally:
+        # Closed early (error, Ctrl-C): drop queued chunks so shutdown only waits for running ones
+        for future in pending:
+            future.cancel()
+
+
+@contextlib.contextmanager
+def _file_results(fn, files, args, jobs):
+    """
+    Context manager yielding an iterator of fn(path, *args) for each file, in input order.
+    With jobs > 1 the work runs in a process pool that is shut down however the block exits,
+    with queued chunks cancelled; otherwise it runs in this process.
+    """
+    if jobs <= 1:
+        yield (fn(path, *args) for path in files)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = _iter_pool_results(executor, fn, files, args, window=jobs * 2)
+        try:
+            yield results
+        finally:
+            results.close()
+
+
+def _validate_captured(md_file, auto_mode, manual_mode, auto_update):
+    """
+    Run validate_one in a batch worker with its output captured.
+    Returns (md_file, returncode, message); returncode is None if validation raised,
+    and message holds the error lines.
+    """
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output):
+            ok = validate_one(md_file, auto_mode, manual_mode, auto_update)
+    except Exception as e:
+        return md_file, None, str(e)
+    # Keep the failure lines and the validation error list that follows them
+    errors = [line for line in output.getvalue().splitlines() if line.startswith(('❌', '  - '))]
+    return md_file, 0 if ok else 1, '\n   '.join(errors)
+
+
+# Number of results collected before buffered batch/report output is written
+OUTPUT_FLUSH_INTERVAL = 100
+
+
+def _write_lines(lines):
+    """Write buffered output lines to stdout in one call and empty the buffer."""
+    if lines:
+        sys.stdout.write('\n'.join(lines) + '\n')
+        lines.clear()
+
+
+def _batch_header(md_file):
+    return f"{SEPN}\n📄 Processing: {md_file}\n{SEP}"
+
+
+def _format_batch_result(md_file, returncode, message):
+    """Render the outcome of one batch run. Returns (ok, text)."""
+    if returncode is None:
+        return False, f"❌ Exception: {md_file} - {message}"
+    if returncode == 0:
+        return True, f"✅ Success: {md_file}"
+    text = f"❌ Error: {md_file}"
+    if message:
+        text += f"\n   {message}"
+    return False, text
+
+
+def _report_one(md_file):
+    """
+    Check the metadata of one file for report mode (runs in a worker process).
+    Returns (md_file, status, details) with status 'valid', 'invalid' (details: errors),
+    'missing' or 'error' (details: message).
+    """
+    try:
+        # Only the header is needed; stop reading once the metadata block closes
+        header = _read_header_lines(md_file)
+        metadata, block_start, block_end = extract_metadata_block(header)
+        if block_end is None:
+            # No closing marker, so the header read reached EOF and holds the whole file.
+            # Bare '\r' line endings only split in text mode: re-split in memory, don't re-read
+            text = ''.join(header)
+            if '\r' in text:
+                lines = io.StringIO(text, newline=None).readlines()
+                metadata, block_start, block_end = extract_metadata_block(lines)
+        if block_start is None:
+            return md_file, 'missing', None
+        errors = validate_metadata(metadata)
+        if errors:
+            return md_file, 'invalid', errors
+        return md_file, 'valid', None
+    except Exception as e:
+        return md_file, 'error', str(e)
+
+
 def main():
     # Valid flags
-    valid_flags = {'--auto', '--manual', '--no-auto-update', '--help', '--batch', '--report'}
+    valid_flags = frozenset({'--auto', '--manual', '--no-auto-update', '--help', '--batch', '--report', '--summary-only'})
     
     # Help message
     if '--help' in sys.argv or len(sys.argv) < 2:
         print("Usage: python metadata_validator.py <markdown_file> [--auto] [--manual] [--no-auto-update]")
-        print("       python metadata_validator.py --batch <directory> [--auto] [--manual]")
-        print("       python metadata_validator.py --report [<directory>]")
+        print("       python metadata_validator.py --batch <directory> [--auto] [--manual] [--jobs N]")
+        print("       python metadata_validator.py --report [<directory>] [--summary-only] [--jobs N]")
         print("       python metadata_validator.py --normalize-dates <changelog_file> [--auto]")
         print("\nModes (choose one):")
         print("  (no flag)      Interactive mode (prompts for all missing/empty fields)")
@@ -687,6 +1285,8 @@ def main():
         print("  --normalize-dates  Normalize changelog dates to YYYY-MM-DD format")
         print("\nOptions:")
         print("  --no-auto-update    Don't automatically update 'Last Updated' field")
+        print("  --summary-only      With --report, print only the summary (no per-file lines)")
+        print("  --jobs N            Worker processes for --batch/--report (default: CPU count)")
         print("  --help              Show this help message")
         print("\n📅 Date Format:")
         print("  All dates should be in YYYY-MM-DD format (e.g., 2025-07-05)")
@@ -696,7 +1296,18 @@ def main():
     
     # Parse flags
     args = sys.argv[1:]
-    flags = set(arg for arg in args if arg.startswith('-'))
+    # Accept "--jobs N" as well as "--jobs=N"
+    if '--jobs' in args:
+        i = args.index('--jobs')
+        args[i:i + 2] = [f"--jobs={args[i + 1] if i + 1 < len(args) else ''}"]
+    flags = frozenset(arg for arg in args if arg.startswith('-'))
+    auto_mode = '--auto' in flags
+    manual_mode = '--manual' in flags
+    auto_update = '--no-auto-update' not in flags
+    jobs = _parse_jobs(flags)
+    if jobs is None:
+        print("❌ Error: --jobs requires a positive integer")
+        sys.exit(1)
     
     # Handle normalize-dates mode
     if '--normalize-dates' in flags:
@@ -722,10 +1333,9 @@ def main():
         validate_changelog_date_format(changelog_file)
         
         # Then normalize dates
-        auto_fix = '--auto' in flags
-        changes_made = normalize_changelog_dates(changelog_file, auto_fix)
+        changes_made = normalize_changelog_dates(changelog_file, auto_mode)
         
-        if changes_made and not auto_fix:
+        if changes_made and not auto_mode:
             print("\n💡 To apply these changes automatically, run with --auto flag")
         
         sys.exit(0)
@@ -744,60 +1354,60 @@ def main():
         
         print(f"🔍 Batch processing markdown files in: {batch_dir}")
         
-        # Find all markdown files
-        markdown_files = []
-        for root, dirs, files in os.walk(batch_dir):
-            # Skip common directories to avoid
-            dirs[:] = [d for d in dirs if d not in ['.git', 'node_modules', '__pycache__', '.venv', 'venv']]
-            for file in files:
-                if file.endswith('.md'):
-                    markdown_files.append(os.path.join(root, file))
-        
-        if not markdown_files:
+        # Stream markdown files as they are discovered; peek to detect an empty tree
+        found = iter_md_files(batch_dir)
+        first = next(found, None)
+        if first is None:
             print("❌ No markdown files found in directory")
             sys.exit(1)
+        markdown_files = chain([first], found)
         
-        print(f"📄 Found {len(markdown_files)} markdown files")
+        # Interactive runs share the terminal, so only --auto/--manual run in parallel
+        parallel = auto_mode or manual_mode
         
         # Process each file
         success_count = 0
         error_count = 0
         
-        for md_file in markdown_files:
-            print(f"\n{'='*60}")
-            print(f"📄 Processing: {md_file}")
-            print(f"{'='*60}")
-            
-            try:
-                # Create new args for this file
-                file_args = [sys.executable, sys.argv[0], md_file]
-                if '--auto' in flags:
-                    file_args.append('--auto')
-                if '--manual' in flags:
-                    file_args.append('--manual')
-                if '--no-auto-update' in flags:
-                    file_args.append('--no-auto-update')
-                
-                result = subprocess.run(file_args, capture_output=True, text=True)
-                
-                if result.returncode == 0:
-                    print(f"✅ Success: {md_file}")
+        if parallel:
+            # Files are independent and never prompt, so validate them in worker processes
+            mode_args = (auto_mode, manual_mode, auto_update)
+            with _file_results(_validate_captured, markdown_files, mode_args, jobs) as results:
+                # Workers return their output as strings; write it in batches, not per line
+                output = []
+                for md_file, returncode, message in results:
+                    ok, text = _format_batch_result(md_file, returncode, message)
+                    output.append(_batch_header(md_file))
+                    output.append(text)
+                    if ok:
+                        success_count += 1
+                    else:
+                        error_count += 1
+                    if (success_count + error_count) % OUTPUT_FLUSH_INTERVAL == 0:
+                        _write_lines(output)
+                _write_lines(output)
+        else:
+            # Interactive: validate in this process so prompts reach the terminal directly
+            for md_file in markdown_files:
+                print(_batch_header(md_file))
+                try:
+                    ok = validate_one(md_file, auto_mode, manual_mode, auto_update)
+                    result = (md_file, 0 if ok else 1, None)
+                except Exception as e:
+                    result = (md_file, None, str(e))
+                ok, text = _format_batch_result(*result)
+                print(text)
+                if ok:
                     success_count += 1
                 else:
-                    print(f"❌ Error: {md_file}")
-                    print(f"   {result.stderr}")
                     error_count += 1
-                    
-            except Exception as e:
-                print(f"❌ Exception: {md_file} - {e}")
-                error_count += 1
         
-        print(f"\n{'='*60}")
+        print(SEPN)
         print(f"📊 Batch Processing Complete")
         print(f"✅ Successful: {success_count}")
         print(f"❌ Errors: {error_count}")
-        print(f"📄 Total: {len(markdown_files)}")
-        print(f"{'='*60}")
+        print(f"📄 Total: {success_count + error_count}")
+        print(SEP)
         sys.exit(0 if error_count == 0 else 1)
     
     # Handle report mode
@@ -809,61 +1419,56 @@ def main():
         
         print(f"📊 Generating validation report for: {report_dir}")
         
-        # Find all markdown files
-        markdown_files = []
-        for root, dirs, files in os.walk(report_dir):
-            dirs[:] = [d for d in dirs if d not in ['.git', 'node_modules', '__pycache__', '.venv', 'venv']]
-            for file in files:
-                if file.endswith('.md'):
-                    markdown_files.append(os.path.join(root, file))
-        
-        if not markdown_files:
+        # Stream markdown files as they are discovered; peek to detect an empty tree
+        found = iter_md_files(report_dir)
+        first = next(found, None)
+        if first is None:
             print("❌ No markdown files found in directory")
             sys.exit(1)
+        markdown_files = chain([first], found)
         
-        print(f"📄 Found {len(markdown_files)} markdown files")
-        print(f"\n📋 Validation Report")
-        print(f"{'='*60}")
+        # With --summary-only, per-file lines are skipped and only the counters are kept
+        summary_only = '--summary-only' in flags
+        if not summary_only:
+            print(f"\n📋 Validation Report")
+            print(SEP)
         
-        total_files = len(markdown_files)
-        valid_files = 0
-        invalid_files = 0
-        missing_metadata = 0
+        # Tally of result statuses: 'valid', 'invalid', 'missing' or 'error'
+        counts = Counter()
         
-        for md_file in markdown_files:
-            try:
-                with open(md_file, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                
-                metadata, block_start, block_end = extract_metadata_block(lines)
-                
-                if block_start is None:
-                    print(f"❌ {md_file}: No metadata block found")
-                    missing_metadata += 1
-                    invalid_files += 1
+        # Files are independent, so check them in worker processes; results come back in order
+        with _file_results(_report_one, markdown_files, (), jobs) as results:
+            output = []
+            for total_files, (md_file, status, details) in enumerate(results, 1):
+                counts[status] += 1
+                if summary_only:
+                    continue
+                if status == 'missing':
+                    output.append(f"❌ {md_file}: No metadata block found")
+                elif status == 'invalid':
+                    output.append(f"⚠️  {md_file}: {len(details)} validation errors")
+                    output.extend(f"   - {error}" for error in details)
+                elif status == 'valid':
+                    output.append(f"✅ {md_file}: Valid metadata")
                 else:
-                    errors = validate_metadata(metadata)
-                    if errors:
-                        print(f"⚠️  {md_file}: {len(errors)} validation errors")
-                        for error in errors:
-                            print(f"   - {error}")
-                        invalid_files += 1
-                    else:
-                        print(f"✅ {md_file}: Valid metadata")
-                        valid_files += 1
-                        
-            except Exception as e:
-                print(f"❌ {md_file}: Error reading file - {e}")
-                invalid_files += 1
+                    output.append(f"❌ {md_file}: Error reading file - {details}")
+                if total_files % OUTPUT_FLUSH_INTERVAL == 0:
+                    _write_lines(output)
+            _write_lines(output)
         
-        print(f"\n{'='*60}")
+        # Missing blocks and unreadable files both count as invalid
+        total_files = sum(counts.values())
+        valid_files = counts['valid']
+        invalid_files = total_files - valid_files
+        missing_metadata = counts['missing']
+        print(SEPN)
         print(f"📊 Summary")
         print(f"✅ Valid files: {valid_files}")
         print(f"⚠️  Invalid files: {invalid_files}")
         print(f"❌ Missing metadata: {missing_metadata}")
         print(f"📄 Total files: {total_files}")
         print(f"📈 Success rate: {(valid_files/total_files)*100:.1f}%")
-        print(f"{'='*60}")
+        print(SEP)
         sys.exit(0)
     
     # Regular single file mode
@@ -876,18 +1481,36 @@ def main():
             print("Use --help to see available options.")
             sys.exit(1)
     # Mutually exclusive check
-    if '--auto' in flags and '--manual' in flags:
+    if auto_mode and manual_mode:
         print("Error: --auto and --manual cannot be used together. Please choose only one mode.")
         sys.exit(1)
-    auto_mode = '--auto' in flags
-    manual_mode = '--manual' in flags
-    auto_update = '--no-auto-update' not in flags
     
-    if not os.path.isfile(md_path):
+    ok = validate_one(md_path, auto_mode, manual_mode, auto_update)
+    wait_for_user_exit()
+    sys.exit(0 if ok else 1)
+
+
+def validate_one(md_path, auto_mode=False, manual_mode=False, auto_update=True):
+    """
+    Validate (and, unless in manual mode, fix) the metadata of a single markdown file.
+    Returns True if the file passed validation, False otherwise.
+    """
+    # One stat both checks for a regular file and keys the text cache for the read
+    try:
+        stat_result = os.stat(md_path)
+    except (OSError, ValueError):
+        stat_result = None
+    if stat_result is None or not stat.S_ISREG(stat_result.st_mode):
         print(f"❌ File not found: {md_path}")
-        wait_for_user_exit()
-        sys.exit(1)
-    
+        return False
+    return _validate_pass(md_path, None, auto_mode, manual_mode, auto_update, stat_result)
+
+
+def _validate_pass(md_path, lines, auto_mode, manual_mode, auto_update, stat_result=None):
+    """
+    One validation pass of validate_one. lines is None on the first pass (read from disk);
+    the re-validation pass after an update is given the lines that were just written.
+    """
     print(f"🔍 Validating metadata for: {md_path}")
     print("📅 Note: All dates should be in YYYY-MM-DD format (e.g., 2025-07-05)")
     if INITIAL_TIMEOUT is None:
@@ -896,24 +1519,23 @@ def main():
         print(f"⏱️  Timeout settings: {INITIAL_TIMEOUT}s initial, {GENTLE_PROMPT_DELAY}s gentle prompt, {FINAL_TIMEOUT}s final")
     print()
     
-    try:
-        with open(md_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-    except Exception as e:
-        print(f"❌ Error reading file: {e}")
-        wait_for_user_exit()
-        sys.exit(1)
+    if lines is None:
+        try:
+            # Read through the text cache so the changelog checks below reuse this read
+            lines = io.StringIO(_load_text(md_path, stat_result)).readlines()
+        except Exception as e:
+            print(f"❌ Error reading file: {e}")
+            return False
     
-    metadata, block_start, block_end = extract_metadata_block(lines)
-    today = datetime.now().strftime('%Y-%m-%d')
+    metadata, block_start, block_end, first_heading = header_scan(lines)
+    today = date.today().isoformat()
     updates = {}
     
     # --- ENHANCED DEFAULT FOR DOCUMENT TITLE ---
     doc_title_default = None
     if 'Document Title' not in metadata or not metadata['Document Title']:
-        heading = extract_first_heading(lines, block_end if block_end is not None else -1)
-        if heading:
-            doc_title_default = heading
+        if first_heading:
+            doc_title_default = first_heading
         else:
             doc_title_default = prettify_filename(md_path)
     else:
@@ -942,7 +1564,7 @@ def main():
     # --- EARLY DATE CHECK/UPDATE ---
     print("📅 Checking for missing or invalid date fields...")
     for date_field in ['Created', 'Last Updated']:
-        if date_field not in metadata or not metadata[date_field] or not re.fullmatch(ISO_DATE_PATTERN, metadata[date_field]):
+        if date_field not in metadata or not metadata[date_field] or not ISO_DATE_RE.fullmatch(metadata[date_field]):
             if auto_mode:
                 updates[date_field] = today
                 print(f"✅ Auto-filled '{date_field}' with {today} (auto mode)")
@@ -955,8 +1577,7 @@ def main():
                     print(f"✅ Filled '{date_field}' with {val}")
                 else:
                     print(f"❌ You chose not to fill '{date_field}'. Please update manually.")
-                    wait_for_user_exit()
-                    sys.exit(1)
+                    return False
     
     # --- AUTO-UPDATE LOGIC (FIXED) ---
     if auto_update and not manual_mode:  # Don't auto-update in manual mode
@@ -964,7 +1585,7 @@ def main():
         # AND if the user didn't just enter today's date in the previous step
         if (
             'Last Updated' not in metadata
-            or not re.fullmatch(ISO_DATE_PATTERN, metadata['Last Updated'])
+            or not ISO_DATE_RE.fullmatch(metadata['Last Updated'])
             or (metadata['Last Updated'] != today and 'Last Updated' not in updates)
         ):
             print(f"🔄 Auto-updating 'Last Updated' to today's date ({today}).")
@@ -975,14 +1596,12 @@ def main():
         print("ℹ️  Manual mode: Skipping auto-update of 'Last Updated' field.")
     
     # --- Handle all other required fields ---
-    for field in REQUIRED_FIELDS:
-        if field in ['Created', 'Last Updated']:
-            continue
+    for field in _OTHER_REQUIRED:
         if field not in metadata or not metadata[field]:
             if field == 'Document Title':
-                default = doc_title_default or DEFAULTS.get(field, '')
+                default = doc_title_default or _OTHER_DEFAULTS[field]
             else:
-                default = today if field in ['Created', 'Last Updated'] else DEFAULTS.get(field, '')
+                default = _OTHER_DEFAULTS[field]
             if auto_mode:
                 updates[field] = default
                 print(f"✅ Auto-filled '{field}' with '{default}' (auto mode)")
@@ -995,29 +1614,24 @@ def main():
                     print(f"✅ Filled '{field}' with '{val}'")
                 else:
                     print(f"❌ You chose not to fill '{field}'. Please update manually.")
-                    wait_for_user_exit()
-                    sys.exit(1)
+                    return False
     
+    # Drop updates that would not change anything, so an unchanged file is not rewritten
+    updates = {field: value for field, value in updates.items() if metadata.get(field) != value}
     if updates:
         try:
-            new_lines = update_metadata_block(lines, metadata, block_start, block_end, updates)
+            new_text = ''.join(update_metadata_block(lines, metadata, block_start, block_end, updates))
+            # One encode and one write for the whole document
             with open(md_path, 'w', encoding='utf-8') as f:
-                f.writelines(new_lines)
-            print("✅ Metadata block updated with new value(s). Re-running validator to complete validation...")
-            # Automatically re-run the validator on the same file
-            args = [sys.executable, sys.argv[0], md_path]
-            if not auto_update:
-                args.append('--no-auto-update')
-            if auto_mode:
-                args.append('--auto')
-            if manual_mode:
-                args.append('--manual')
-            subprocess.run(args)
-            sys.exit(0)
+                f.write(new_text)
+            _clear_text_caches()
         except Exception as e:
             print(f"❌ Error updating file: {e}")
-            wait_for_user_exit()
-            sys.exit(1)
+            return False
+        print("✅ Metadata block updated with new value(s). Re-running validator to complete validation...")
+        # Re-run the validator on the updated content; split it as a re-read of the file would
+        new_lines = io.StringIO(new_text).readlines()
+        return _validate_pass(md_path, new_lines, auto_mode, manual_mode, auto_update)
     
     # --- END EARLY DATE CHECK/UPDATE ---
     print("🔍 Running full metadata validation...")
@@ -1028,8 +1642,7 @@ def main():
             print(f"  - {err}")
         print("\nPlease update the metadata block and re-run the validator.")
         display_metadata(metadata)
-        wait_for_user_exit()
-        sys.exit(1)
+        return False
     print("✅ Metadata validation passed!")
     display_metadata(metadata)
     
@@ -1037,10 +1650,13 @@ def main():
     if 'Version' in metadata and metadata['Version']:
         print("\n📋 Checking changelog consistency...")
         file_directory = os.path.dirname(os.path.abspath(md_path))
-        changelog_consistent = check_changelog_consistency(metadata['Version'], md_path, file_directory)
+        # Look up the separate changelog once for both checks below
+        changelog_path = find_changelog_file(file_directory)
+        changelog_consistent = check_changelog_consistency(
+            metadata['Version'], md_path, file_directory, changelog_path, today
+        )
         
         # Check changelog date format if separate changelog exists
-        changelog_path = find_changelog_file(file_directory)
         if changelog_path:
             print("📅 Checking changelog date formats...")
             date_format_ok = validate_changelog_date_format(changelog_path)
@@ -1058,12 +1674,12 @@ def main():
             print(f"📝 Suggested heading level: {placement_info['heading_level']}")
             
             print("\n📋 You can add a new entry like this:")
-            print(suggest_changelog_entry(metadata['Version']))
+            print(suggest_changelog_entry(metadata['Version'], today=today))
             
             print("\n📖 Example structure for this document type:")
             print(placement_info['example'])
     
-    wait_for_user_exit()
+    return True
 
 
 def prompt_field(field, default=None, auto_mode=False):
@@ -1079,8 +1695,7 @@ def prompt_field(field, default=None, auto_mode=False):
         prompt += "\n(If left blank, the script will use the first heading or filename as the title.)"
     prompt += "\n(Press Enter to accept the default, or type your value.)\n"
     
-    timeout_input = TimeoutInput(INITIAL_TIMEOUT, GENTLE_PROMPT_DELAY, FINAL_TIMEOUT)
-    resp = timeout_input.get_input_with_timeout(prompt)
+    resp = _TIMEOUT_INPUT.get_input_with_timeout(prompt)
     if resp is None or resp.strip() == '':
         return default
     
@@ -1095,8 +1710,7 @@ def prompt_field(field, default=None, auto_mode=False):
             
             if not auto_mode:  # Only ask for confirmation in interactive mode
                 confirm_prompt = f"Is this correct? [Y/n]: "
-                timeout_input = TimeoutInput(INITIAL_TIMEOUT, GENTLE_PROMPT_DELAY, FINAL_TIMEOUT)
-                confirm_resp = timeout_input.get_input_with_timeout(confirm_prompt)
+                confirm_resp = _TIMEOUT_INPUT.get_input_with_timeout(confirm_prompt)
                 if confirm_resp is None:
                     print("Timeout reached. Using original input as-is.")
                     return user_input
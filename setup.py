@@ -74,6 +74,9 @@ setup(
             "black>=21.0",
             "flake8>=3.8",
         ],
+        "fast": [
+            "google-re2>=1.1",
+        ],
     },
     entry_points={
         "console_scripts": [
@@ -15,10 +15,12 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from metadata_validator import (
     find_changelog_file,
+    find_changelog_files,
     extract_changelog_section_from_file,
     determine_changelog_preference,
     extract_latest_version_from_changelog,
     check_changelog_consistency,
+    normalize_changelog_dates,
     suggest_changelog_entry,
     suggest_changelog_placement
 )
@@ -73,6 +75,37 @@ class TestChangelogValidation(unittest.TestCase):
         found_path = find_changelog_file(self.temp_dir)
         self.assertIsNone(found_path)
 
+    def test_find_changelog_files_batch(self):
+        """Test batch lookup maps every file to its directory's changelog."""
+        changelog_path = os.path.join(self.temp_dir, "CHANGELOG.md")
+        with open(changelog_path, 'w') as f:
+            f.write("# Changelog\n")
+        sub_dir = os.path.join(self.temp_dir, "sub")
+        os.mkdir(sub_dir)
+        
+        doc_a = os.path.join(self.temp_dir, "a.md")
+        doc_b = os.path.join(self.temp_dir, "b.md")
+        doc_c = os.path.join(sub_dir, "c.md")
+        found = find_changelog_files([doc_a, doc_b, doc_c])
+        self.assertEqual(found, {doc_a: changelog_path, doc_b: changelog_path, doc_c: None})
+
+    def test_find_changelog_file_sees_new_changelog(self):
+        """Test that a changelog created after a lookup is found on the next call."""
+        self.assertIsNone(find_changelog_file(self.temp_dir))
+        changelog_path = os.path.join(self.temp_dir, "CHANGELOG.md")
+        with open(changelog_path, 'w') as f:
+            f.write("# Changelog\n")
+        self.assertEqual(find_changelog_file(self.temp_dir), changelog_path)
+
+    def test_find_changelog_file_case_insensitive_filesystem(self):
+        """Test that a differently-cased changelog is found where the filesystem ignores case."""
+        with open(os.path.join(self.temp_dir, "ChangeLog.md"), 'w') as f:
+            f.write("# Changelog\n")
+        expected = os.path.join(self.temp_dir, "CHANGELOG.md")
+        # Simulate a case-insensitive filesystem resolving CHANGELOG.md to ChangeLog.md
+        with patch('metadata_validator.metadata_validator.os.path.exists', side_effect=lambda path: path == expected):
+            self.assertEqual(find_changelog_file(self.temp_dir), expected)
+
     def test_extract_latest_version_standard_format(self):
         """Test extracting version from standard Keep a Changelog format."""
         changelog_content = """# Changelog
@@ -197,6 +230,18 @@ More content.
                 preference = determine_changelog_preference("README.md", self.temp_dir)
                 self.assertEqual(preference, "embedded")
 
+    def test_determine_changelog_preference_precomputed(self):
+        """Test that precomputed changelog lookups are used without rediscovery."""
+        with patch('metadata_validator.metadata_validator.find_changelog_file') as mock_find:
+            with patch('metadata_validator.metadata_validator.extract_changelog_section_from_file') as mock_extract:
+                preference = determine_changelog_preference(
+                    "README.md", self.temp_dir,
+                    separate_changelog=None, embedded_changelog="## [1.0.0]"
+                )
+                self.assertEqual(preference, "embedded")
+                mock_find.assert_not_called()
+                mock_extract.assert_not_called()
+
     def test_check_changelog_consistency_separate_match(self):
         """Test when metadata version matches separate changelog version."""
         changelog_content = """# Changelog
@@ -216,6 +261,30 @@ More content.
                             result = check_changelog_consistency("1.0.0", "fake_file.md", self.temp_dir)
                             self.assertTrue(result)
 
+    def test_check_changelog_consistency_precomputed_path(self):
+        """Test that a changelog path passed in by the caller is used without rediscovery."""
+        changelog_path = os.path.join(self.temp_dir, "CHANGELOG.md")
+        with patch('metadata_validator.metadata_validator.find_changelog_file') as mock_find:
+            with patch('metadata_validator.metadata_validator.extract_latest_version_from_changelog', return_value="1.0.0"):
+                with patch('metadata_validator.metadata_validator.extract_changelog_section_from_file', return_value=None):
+                    with patch('builtins.print'):
+                        result = check_changelog_consistency("1.0.0", "fake_file.md", self.temp_dir, changelog_path)
+                    self.assertTrue(result)
+                    mock_find.assert_not_called()
+
+    def test_check_changelog_consistency_uses_given_today(self):
+        """Test that the caller's date is used in the suggested changelog entry."""
+        changelog_path = os.path.join(self.temp_dir, "CHANGELOG.md")
+        with patch('metadata_validator.metadata_validator.extract_latest_version_from_changelog', return_value="1.0.0"):
+            with patch('metadata_validator.metadata_validator.extract_changelog_section_from_file', return_value=None):
+                with patch('builtins.print') as mock_print:
+                    result = check_changelog_consistency(
+                        "2.0.0", "fake_file.md", self.temp_dir, changelog_path, today=self.today
+                    )
+        self.assertFalse(result)
+        printed = "\n".join(str(call.args[0]) for call in mock_print.call_args_list if call.args)
+        self.assertIn("## [2.0.0] - 2025-07-05", printed)
+
     def test_check_changelog_consistency_embedded_match(self):
         """Test when metadata version matches embedded changelog version."""
         changelog_content = """## [1.0.0] - 2025-07-05
@@ -239,31 +308,31 @@ More content.
                     result = check_changelog_consistency("1.0.0", "fake_file.md", self.temp_dir)
                     self.assertTrue(result)
 
-    @patch('metadata_validator.metadata_validator.datetime')
-    def test_suggest_changelog_entry_patch(self, mock_datetime):
+    @patch('metadata_validator.metadata_validator.date')
+    def test_suggest_changelog_entry_patch(self, mock_date):
         """Test generating patch changelog entry."""
-        mock_datetime.now.return_value.strftime.return_value = self.today
+        mock_date.today.return_value.isoformat.return_value = self.today
         entry = suggest_changelog_entry("1.0.1", "patch")
         self.assertIn("## [1.0.1] - 2025-07-05", entry)
 
-    @patch('metadata_validator.metadata_validator.datetime')
-    def test_suggest_changelog_entry_minor(self, mock_datetime):
+    @patch('metadata_validator.metadata_validator.date')
+    def test_suggest_changelog_entry_minor(self, mock_date):
         """Test generating minor changelog entry."""
-        mock_datetime.now.return_value.strftime.return_value = self.today
+        mock_date.today.return_value.isoformat.return_value = self.today
         entry = suggest_changelog_entry("1.1.0", "minor")
         self.assertIn("## [1.1.0] - 2025-07-05", entry)
 
-    @patch('metadata_validator.metadata_validator.datetime')
-    def test_suggest_changelog_entry_major(self, mock_datetime):
+    @patch('metadata_validator.metadata_validator.date')
+    def test_suggest_changelog_entry_major(self, mock_date):
         """Test generating major changelog entry."""
-        mock_datetime.now.return_value.strftime.return_value = self.today
+        mock_date.today.return_value.isoformat.return_value = self.today
         entry = suggest_changelog_entry("2.0.0", "major")
         self.assertIn("## [2.0.0] - 2025-07-05", entry)
 
-    @patch('metadata_validator.metadata_validator.datetime')
-    def test_suggest_changelog_entry_default(self, mock_datetime):
+    @patch('metadata_validator.metadata_validator.date')
+    def test_suggest_changelog_entry_default(self, mock_date):
         """Test generating default (patch) changelog entry."""
-        mock_datetime.now.return_value.strftime.return_value = self.today
+        mock_date.today.return_value.isoformat.return_value = self.today
         entry = suggest_changelog_entry("1.0.1")
         self.assertIn("## [1.0.1] - 2025-07-05", entry)
 
@@ -312,6 +381,23 @@ More content.
             if changelog_section:
                 self.assertIn("## [1.0.0] - 2025-07-05", changelog_section)
 
+    def test_normalize_changelog_dates_auto_fix(self):
+        """Test that non-ISO changelog dates are rewritten and ISO dates are left alone."""
+        changelog_path = os.path.join(self.temp_dir, "CHANGELOG.md")
+        with open(changelog_path, 'w', encoding='utf-8') as f:
+            f.write("# Changelog\n\n## [1.1.0] - July 5, 2025\n\n## [1.0.0] - 2025-01-15\n\n## [0.9.0] - 12/25/2024\n")
+
+        with patch('builtins.print'):
+            changed = normalize_changelog_dates(changelog_path, auto_fix=True)
+        self.assertTrue(changed)
+        with open(changelog_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        self.assertEqual(content, "# Changelog\n\n## [1.1.0] - 2025-07-05\n\n## [1.0.0] - 2025-01-15\n\n## [0.9.0] - 2024-12-25\n")
+
+        # Already normalized: nothing left to change
+        with patch('builtins.print'):
+            self.assertFalse(normalize_changelog_dates(changelog_path, auto_fix=True))
+
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -16,6 +16,14 @@ from datetime import datetime
 # Add parent directory to path for imports
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from metadata_validator import normalize_date_format
+try:
+    # Package layout: private names are not re-exported by the package __init__
+    from metadata_validator.metadata_validator import (
+        _DATE_ALTS, _DATE_READINGS, _readings_for_locale, _norm_cache_clear
+    )
+except ImportError:
+    # Run as a script (setup_integration.py): metadata_validator is the module itself
+    from metadata_validator import _DATE_ALTS, _DATE_READINGS, _readings_for_locale, _norm_cache_clear
 
 def test_date_normalization():
     """Test comprehensive date format normalization."""
@@ -184,6 +192,31 @@ def test_compact_format_edge_cases():
     print(f"\n📊 Compact Format Results: {passed} passed, {failed} failed")
     return passed, failed
 
+def test_date_alternatives_are_distinct():
+    """Each date shape appears once; a duplicate alternative could never be reached."""
+    bodies = [body for name, body in _DATE_ALTS]
+    assert len(set(bodies)) == len(bodies)
+    assert [name for name, body in _DATE_ALTS] == list(_DATE_READINGS)
+
+def test_locale_reading_order():
+    """The 'eu' locale tries day-first readings before month-first ones."""
+    us = _readings_for_locale(_DATE_READINGS, 'us')
+    eu = _readings_for_locale(_DATE_READINGS, 'eu')
+    assert us['slash_long'][0][0] == 'MM/DD/YYYY'
+    assert eu['slash_long'][0][0] == 'DD/MM/YYYY'
+    assert [name for name, reading in eu['dot_ambiguous']] == ['YY.MM.DD', 'DD.MM.YY', 'MM.DD.YY']
+    assert eu['month_comma'] == us['month_comma']
+
+def test_normalize_date_format_memoized():
+    """Repeated date strings are answered from the cache; _norm_cache_clear empties it."""
+    _norm_cache_clear()
+    first = normalize_date_format("7/5/25")
+    assert normalize_date_format("7/5/25") == first == ("2025-07-05", True, "MM/DD/YY")
+    info = normalize_date_format.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+    _norm_cache_clear()
+    assert normalize_date_format.cache_info().currsize == 0
+
 def main():
     """Main testing execution."""
     print("🧪 EXTENDED DATE FORMAT TESTING SUITE")
@@ -0,0 +1,56 @@
+"""
+Test suite for markdown file discovery.
+Tests walking a directory tree for markdown files.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to the path to import metadata_validator
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metadata_validator import iter_md_files
+
+
+class TestFileDiscovery(unittest.TestCase):
+    """Test cases for markdown file discovery."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.content = "# Test Document\n"
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name, content):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_iter_md_files_matches_os_walk(self):
+        """Test that discovery finds the same files, in the same order, as os.walk."""
+        for sub in ("a", os.path.join("a", "b"), ".git", "node_modules"):
+            os.makedirs(os.path.join(self.temp_dir, sub), exist_ok=True)
+        for name in ("top.md", "notes.txt", os.path.join("a", "one.md"),
+                     os.path.join("a", "b", "two.md"), os.path.join(".git", "skip.md"),
+                     os.path.join("node_modules", "skip.md")):
+            self._write(name, self.content)
+
+        expected = []
+        for root, dirs, files in os.walk(self.temp_dir):
+            dirs[:] = [d for d in dirs if d not in ['.git', 'node_modules', '__pycache__', '.venv', 'venv']]
+            expected.extend(os.path.join(root, f) for f in files if f.endswith('.md'))
+
+        found = list(iter_md_files(self.temp_dir))
+        self.assertEqual(found, expected)
+        self.assertEqual(len(found), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+"""
+Test suite for metadata block extraction.
+Tests parsing the metadata block from lines and directly from files.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+
+# Add the parent directory to the path to import metadata_validator
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metadata_validator import (
+    extract_metadata_block,
+    extract_metadata_block_from_path,
+    extract_first_heading,
+    header_scan
+)
+
+
+class TestMetadataBlock(unittest.TestCase):
+    """Test cases for metadata block extraction."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.content = (
+            "---\n"
+            "# Metadata\n"
+            "- **Document Title:** Test Document\n"
+            "- **Author:** Test Author\n"
+            "- **Description:**\n"
+            "---\n"
+            "\n"
+            "# Test Document\n"
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name, content):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_extract_metadata_block_from_path_matches_lines(self):
+        """Test that reading from a path gives the same result as parsing all lines."""
+        path = self._write("doc.md", self.content)
+        expected = extract_metadata_block(self.content.splitlines(keepends=True))
+        self.assertEqual(extract_metadata_block_from_path(path), expected)
+        self.assertEqual(expected[0]['Description'], '')
+        self.assertEqual(expected[1:], (0, 5))
+
+    def test_extract_metadata_block_from_path_large_file(self):
+        """Test a file large enough to be memory-mapped, with rules after the block."""
+        body = "Body text.\n" * 2000 + "---\n- **Author:** Not Metadata\n---\n"
+        path = self._write("large.md", self.content + body)
+        metadata, block_start, block_end = extract_metadata_block_from_path(path)
+        self.assertEqual(metadata['Author'], 'Test Author')
+        self.assertEqual((block_start, block_end), (0, 5))
+
+    def test_extract_metadata_block_from_path_empty_file(self):
+        """Test that an empty file has no metadata block."""
+        path = self._write("empty.md", "")
+        self.assertEqual(extract_metadata_block_from_path(path), ({}, None, None))
+
+    def test_header_scan_matches_separate_passes(self):
+        """Test that the single-pass scan agrees with extract_metadata_block plus extract_first_heading."""
+        unclosed = "# Intro\n---\n- **Author:** Test Author\n"
+        for content in (self.content, unclosed, "No metadata\n## Heading\n", ""):
+            lines = content.splitlines(keepends=True)
+            metadata, block_start, block_end = extract_metadata_block(lines)
+            heading = extract_first_heading(lines, block_end if block_end is not None else -1)
+            self.assertEqual(header_scan(lines), (metadata, block_start, block_end, heading))
+        self.assertEqual(header_scan(self.content.splitlines(keepends=True))[3], "Test Document")
+
+
+if __name__ == '__main__':
+    unittest.main()
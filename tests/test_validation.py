@@ -0,0 +1,85 @@
+"""
+Test suite for the per-file validation pass.
+Tests validating, auto-filling and re-validating a single markdown file.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add the parent directory to the path to import metadata_validator
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from metadata_validator import (
+    extract_metadata_block_from_path,
+    validate_one
+)
+
+
+class TestValidation(unittest.TestCase):
+    """Test cases for validating a single file."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.content = (
+            "---\n"
+            "# Metadata\n"
+            "- **Document Title:** Test Document\n"
+            "- **Author:** Test Author\n"
+            "- **Description:**\n"
+            "---\n"
+            "\n"
+            "# Test Document\n"
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        import shutil
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, name, content):
+        path = os.path.join(self.temp_dir, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_validate_one_manual_reports_missing_fields(self):
+        """Test that manual mode reports missing fields without changing the file."""
+        path = self._write("doc.md", self.content)
+        with patch('builtins.print'):
+            self.assertFalse(validate_one(path, manual_mode=True))
+        with open(path, 'r', encoding='utf-8') as f:
+            self.assertEqual(f.read(), self.content)
+
+    def test_validate_one_auto_fills_and_revalidates(self):
+        """Test that auto mode fills missing fields and passes on the re-run."""
+        path = self._write("doc.md", self.content)
+        with patch('builtins.print'):
+            self.assertTrue(validate_one(path, auto_mode=True))
+        metadata, block_start, block_end = extract_metadata_block_from_path(path)
+        self.assertEqual(metadata['Document Title'], 'Test Document')
+        self.assertEqual(metadata['Version'], '0.1.0')
+
+    def test_validate_one_skips_no_op_updates(self):
+        """Test that an update which would not change the file is dropped instead of rewriting it."""
+        path = self._write("doc.md", self.content)
+        with patch.dict('metadata_validator.metadata_validator._OTHER_DEFAULTS', {'Description': ''}):
+            with patch('builtins.print'):
+                # Other fields are filled; Description stays empty instead of being rewritten forever
+                self.assertFalse(validate_one(path, auto_mode=True))
+                with patch('metadata_validator.metadata_validator.update_metadata_block') as mock_update:
+                    # Description is still empty and its default is empty: nothing to write
+                    self.assertFalse(validate_one(path, auto_mode=True))
+                    mock_update.assert_not_called()
+
+    def test_validate_one_missing_file(self):
+        """Test that a missing file fails without exiting."""
+        with patch('builtins.print'):
+            self.assertFalse(validate_one(os.path.join(self.temp_dir, "missing.md"), auto_mode=True))
+
+
+if __name__ == '__main__':
+    unittest.main()